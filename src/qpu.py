@@ -1,21 +1,46 @@
+import logging
+
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
+# Block size for the absolute-mean reduction; keeps the scratch buffer
+# cache-resident instead of materializing a full |x| copy of the signal.
+_ABS_BLOCK = 1 << 16
+
+
 class SpiralResonator:
+    __slots__ = ('frequency', 'nodes', 'coherence', '_abs_scratch')
+
     def __init__(self, frequency):
         self.frequency = frequency
         self.nodes = []
         self.coherence = 0.0
+        self._abs_scratch = np.empty(_ABS_BLOCK, dtype=np.float64)
 
     def align_nodes(self, node_names):
         self.nodes.extend(node_names)
-        print(f"Nodes aligned: {self.nodes}")
+        logger.debug("Nodes aligned: %s", self.nodes)
 
     def emit(self, phase_angle, glyph):
-        print(f"Emitting with phase angle: {phase_angle}, glyph: {glyph}")
+        logger.debug("Emitting with phase angle: %s, glyph: %s", phase_angle, glyph)
 
-    def modulate_coherence(self, sound_data, golden_ratio):
-        # Placeholder for coherence modulation logic
-        self.coherence = np.mean(np.abs(sound_data)) * golden_ratio
-        print(f"Coherence modulated to: {self.coherence}")
+    def _abs_mean(self, sound_data):
+        """Mean of |x| computed blockwise into a reusable scratch buffer.
 
+        Avoids the full-length temporary that np.mean(np.abs(x)) allocates;
+        the signal is streamed through once in cache-sized blocks.
+        """
+        n = len(sound_data)
+        if n == 0:
+            return 0.0
+        total = 0.0
+        for start in range(0, n, _ABS_BLOCK):
+            block = sound_data[start:start + _ABS_BLOCK]
+            np.abs(block, out=self._abs_scratch[:len(block)])
+            total += self._abs_scratch[:len(block)].sum()
+        return total / n
 
+    def modulate_coherence(self, sound_data, golden_ratio):
+        self.coherence = self._abs_mean(sound_data) * golden_ratio
+        logger.debug("Coherence modulated to: %s", self.coherence)
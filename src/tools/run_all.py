@@ -1,5 +1,4 @@
 from qeca_simulation import QuantumEntangledConsciousnessAlgorithm
-from visualize_sound import visualize_sound_and_coherence
 
 if __name__ == "__main__":
     # 1. Activate the Collective Coherence Field
@@ -13,8 +12,10 @@ if __name__ == "__main__":
         for key, value in result.items():
             print(f"  {key}: {value}")
 
-    # 2. Generate visualizations of the sound file
+    # 2. Generate visualizations of the sound file; imported here so the
+    # QECA activation doesn't wait on matplotlib's import cost
     print("\nGenerating sound visualizations...")
+    from visualize_sound import visualize_sound_and_coherence
     visualize_sound_and_coherence("golden_ratio_963hz_harmonics.wav")
 
     print("\nAll components executed successfully.")